@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Tests for the lazily paginated ResultBrowser using stub sites
+"""
+
+import io
+import unittest
+from contextlib import redirect_stdout
+
+from torrench import TorrentSite, TorrentSearcher, ResultBrowser
+
+
+class StubSite(TorrentSite):
+    """Site serving a fixed number of pages of generated results"""
+    def __init__(self, name, page_count, per_page=2):
+        super().__init__(name, "https://stub.invalid")
+        self.working_url = self.base_urls[0]
+        self.page_count = page_count
+        self.per_page = per_page
+        self.calls = 0
+        self.failing_pages = set()
+
+    def search(self, query, page=0):
+        self.calls += 1
+        if page in self.failing_pages:
+            return None
+        if page >= self.page_count:
+            return []
+        return [make_result(f"{self.name}{page}-{i}", self.name, seeds=str(100 - page * 10 - i))
+                for i in range(self.per_page)]
+
+
+class NoPagingSite(StubSite):
+    """Site that ignores the page parameter"""
+    def search(self, query, page=0):
+        return super().search(query, 0)
+
+
+def make_result(name, site, seeds="0", size="1 MB"):
+    return {
+        'name': name,
+        'category': "Unknown",
+        'uploader': "Unknown",
+        'seeds': seeds,
+        'leeches': "0",
+        'date': "Unknown",
+        'size': size,
+        'detail_url': f"https://stub.invalid/{name}",
+        'site': site,
+        'is_vip': False,
+        'is_trusted': False
+    }
+
+
+def make_browser(sites, window=4, limit=None, pages=1):
+    searcher = TorrentSearcher()
+    searcher.working_sites = sites
+    browser = ResultBrowser(searcher, "query", window, limit)
+    with redirect_stdout(io.StringIO()):
+        browser.load_pages(pages)
+    return browser
+
+
+def quietly(func, *args):
+    with redirect_stdout(io.StringIO()):
+        return func(*args)
+
+
+def names(results):
+    return [r['name'] for r in results]
+
+
+class ResultBrowserTest(unittest.TestCase):
+    def test_paging_keeps_seen_rows_in_place(self):
+        browser = make_browser([StubSite("A", 3), StubSite("B", 3)])
+        first_page = names(browser.view[:4])
+
+        self.assertTrue(quietly(browser.next_page))
+
+        self.assertEqual(names(browser.view[:4]), first_page)
+        self.assertEqual(browser.offset, 4)
+        self.assertEqual(names(browser.view[4:8]), ["A1-0", "B1-0", "A1-1", "B1-1"])
+
+    def test_next_page_fetches_at_most_one_round(self):
+        sites = [StubSite("A", 5), StubSite("B", 5)]
+        browser = make_browser(sites)
+        browser.filter_text = "nothing matches"
+        browser.rebuild_view()
+
+        self.assertIsNone(quietly(browser.next_page))
+
+        self.assertEqual([site.calls for site in sites], [2, 2])
+        self.assertEqual(browser.offset, 0)
+
+    def test_partial_window_is_filled_before_advancing(self):
+        browser = make_browser([StubSite("A", 3, per_page=3)], window=4)
+
+        quietly(browser.next_page)
+
+        self.assertEqual(browser.offset, 0)
+        self.assertEqual(len(browser.view), 6)
+        quietly(browser.next_page)
+        self.assertEqual(browser.offset, 4)
+
+    def test_site_ignoring_paging_is_exhausted(self):
+        site = NoPagingSite("A", 3)
+        browser = make_browser([site], pages=3)
+
+        self.assertEqual(len(browser.view), 2)
+        self.assertIn("A", browser.exhausted)
+        self.assertEqual(site.calls, 2)
+
+    def test_failed_fetch_is_retried(self):
+        site = StubSite("A", 3)
+        site.failing_pages.add(1)
+        browser = make_browser([site], window=2)
+
+        quietly(browser.next_page)
+        self.assertNotIn("A", browser.exhausted)
+        self.assertEqual(len(browser.view), 2)
+
+        site.failing_pages.clear()
+        quietly(browser.next_page)
+        self.assertEqual(len(browser.view), 4)
+
+    def test_failing_site_is_given_up(self):
+        site = StubSite("B", 5)
+        site.failing_pages.update(range(1, 5))
+        browser = make_browser([StubSite("A", 1), site], window=2)
+
+        self.assertTrue(quietly(browser.next_page))
+        self.assertEqual(browser.offset, 2)
+        self.assertIsNone(quietly(browser.next_page))
+        self.assertNotIn("B", browser.exhausted)
+        self.assertFalse(quietly(browser.next_page))
+        self.assertIn("B", browser.exhausted)
+        self.assertFalse(browser.can_load_more())
+        self.assertFalse(quietly(browser.next_page))
+        self.assertEqual(site.calls, 3)
+        self.assertEqual(browser.offset, 2)
+
+    def test_duplicates_within_a_page_are_removed(self):
+        class DuplicateSite(StubSite):
+            def search(self, query, page=0):
+                results = super().search(query, page)
+                return results + results if results else results
+
+        browser = make_browser([DuplicateSite("A", 1)])
+
+        self.assertEqual(names(browser.view), ["A0-0", "A0-1"])
+
+    def test_sort_and_filter_use_cached_pages_only(self):
+        sites = [StubSite("A", 3), StubSite("B", 3)]
+        browser = make_browser(sites, pages=2)
+        calls = [site.calls for site in sites]
+
+        browser.sort_field = 'name'
+        browser.rebuild_view()
+        self.assertEqual(names(browser.view), sorted(names(browser.view), key=str.lower))
+
+        browser.filter_text = "b1"
+        browser.rebuild_view()
+        self.assertEqual(names(browser.view), ["B1-0", "B1-1"])
+
+        self.assertEqual([site.calls for site in sites], calls)
+
+    def test_limit_stops_loading(self):
+        site = StubSite("A", 5)
+        browser = make_browser([site], window=2, limit=3)
+
+        self.assertTrue(quietly(browser.next_page))
+        self.assertEqual(len(browser.view), 3)
+        self.assertEqual(browser.offset, 2)
+        self.assertFalse(browser.can_load_more())
+        self.assertFalse(quietly(browser.next_page))
+        self.assertEqual(site.calls, 2)
+
+    def test_size_with_thousands_separator(self):
+        browser = make_browser([])
+
+        self.assertEqual(browser.size_to_bytes("1,234.5 MB"), 1234.5 * 1024 ** 2)
+        self.assertEqual(browser.size_to_bytes("Unknown"), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -37,19 +37,20 @@ class TorrentSite:
         return False
     
     def search(self, query, page=0):
-        """Search for torrents on this site"""
+        """Search for torrents on this site, returns None if the request failed"""
         if not self.working_url:
-            return []
+            return None
         
         try:
             search_url = self.build_search_url(query, page)
             response = requests.get(search_url, timeout=15)
             if response.status_code == 200:
                 return self.parse_results(response.content, query)
+            print(colored(f"Error searching {self.name}: HTTP {response.status_code}", "red"))
         except Exception as e:
             print(colored(f"Error searching {self.name}: {e}", "red"))
         
-        return []
+        return None
     
     def build_search_url(self, query, page=0):
         """Build search URL - to be implemented by subclasses"""
@@ -452,30 +453,11 @@ class TorrentSearcher:
         print(colored(f"\nFound {len(self.working_sites)} working sites", "green"))
         return True
     
-    def search_all_sites(self, query, page_limit=1):
-        """Search all working sites"""
-        all_results = []
-        
-        for site in self.working_sites:
-            print(colored(f"\nSearching {site.name}...", "yellow"))
-            try:
-                for page in range(page_limit):
-                    results = site.search(query, page)
-                    if results:
-                        all_results.extend(results)
-                        print(colored(f"Found {len(results)} results from {site.name} (page {page + 1})", "green"))
-                    else:
-                        break  # No more results
-            except Exception as e:
-                print(colored(f"Error searching {site.name}: {e}", "red"))
-        
-        return all_results
-    
-    def format_results(self, results):
+    def format_results(self, results, start=1):
         """Format results for display"""
         formatted_results = []
         
-        for i, result in enumerate(results, 1):
+        for i, result in enumerate(results, start):
             name = result['name']
             
             # Apply color coding for VIP/Trusted
@@ -498,6 +480,268 @@ class TorrentSearcher:
         
         return formatted_results
 
+class ResultBrowser:
+    """Interactive result browser that fetches further pages lazily per site"""
+    headers = ['SITE', 'CATEGORY', 'NAME', 'INDEX', 'UPLOADER', 'SIZE', 'SEEDS', 'LEECHES', 'DATE']
+    sort_fields = ['seeds', 'leeches', 'size', 'name', 'site']
+    size_units = {'B': 1, 'KB': 1024, 'KIB': 1024, 'MB': 1024 ** 2, 'MIB': 1024 ** 2,
+                  'GB': 1024 ** 3, 'GIB': 1024 ** 3, 'TB': 1024 ** 4, 'TIB': 1024 ** 4}
+    max_failures = 2
+    
+    def __init__(self, searcher, query, window=20, limit=None):
+        self.searcher = searcher
+        self.query = query
+        self.window = window
+        self.limit = limit
+        self.offset = 0
+        self.sort_field = 'seeds'
+        self.filter_text = None
+        # Fetched pages are kept per site so paging back or re-sorting never hits the network
+        self.pages = {site.name: [] for site in searcher.working_sites}
+        self.exhausted = set()
+        self.failures = {site.name: 0 for site in searcher.working_sites}
+        self.seen_urls = set()
+        self.view = []
+    
+    def fetch_next_page(self, site):
+        """Fetch the next page of a site and return its new results"""
+        if site.name in self.exhausted:
+            return []
+        
+        page = len(self.pages[site.name])
+        print(colored(f"Searching {site.name} (page {page + 1})...", "yellow"))
+        raw_results = site.search(self.query, page)
+        
+        if raw_results is None:
+            self.failures[site.name] += 1
+            if self.failures[site.name] >= self.max_failures:
+                self.exhausted.add(site.name)
+                print(colored(f"Could not fetch page {page + 1} from {site.name}, giving up on this site", "red"))
+            else:
+                print(colored(f"Could not fetch page {page + 1} from {site.name}, it will be retried on the next load", "red"))
+            return []
+        
+        self.failures[site.name] = 0
+        
+        if not raw_results:
+            self.exhausted.add(site.name)
+            print(colored(f"No more results from {site.name}", "yellow"))
+            return []
+        
+        results = []
+        for result in raw_results:
+            if result['detail_url'] not in self.seen_urls:
+                self.seen_urls.add(result['detail_url'])
+                results.append(result)
+        
+        # Sites that ignore the page parameter keep returning the same rows
+        if not results:
+            self.exhausted.add(site.name)
+            print(colored(f"{site.name} returned no new results, it does not seem to support paging", "yellow"))
+            return []
+        
+        self.pages[site.name].append(results)
+        print(colored(f"Found {len(results)} results from {site.name} (page {page + 1})", "green"))
+        return results
+    
+    def load_pages(self, page_limit):
+        """Fetch the first page_limit pages of every working site"""
+        for site in self.searcher.working_sites:
+            while len(self.pages[site.name]) < page_limit:
+                if not self.fetch_next_page(site):
+                    break
+        self.rebuild_view()
+    
+    def load_more(self):
+        """Fetch one more page from every site that still has results and append them to the view"""
+        results = []
+        try:
+            for site in self.searcher.working_sites:
+                results.extend(self.fetch_next_page(site))
+        except KeyboardInterrupt:
+            print(colored("\nFetch cancelled", "yellow"))
+        
+        # New rows go after the ones already shown so earlier pages and indexes stay put
+        new_rows = self.sorted_rows(self.filtered_rows(results))
+        self.view.extend(new_rows)
+        if self.limit:
+            del self.view[self.limit:]
+        return len(new_rows)
+    
+    def has_more(self):
+        """Check whether any site may still return further pages"""
+        return len(self.exhausted) < len(self.searcher.working_sites)
+    
+    def can_load_more(self):
+        """Check whether fetching more pages could still grow the view"""
+        if self.limit and len(self.view) >= self.limit:
+            return False
+        return self.has_more()
+    
+    def size_to_bytes(self, size):
+        """Convert a size string like '1,234.5 MB' to bytes for sorting"""
+        match = re.match(r'(\d+\.?\d*)\s*([A-Za-z]+)', size.replace(',', '').replace('\xa0', ' '))
+        if not match:
+            return 0
+        return float(match.group(1)) * self.size_units.get(match.group(2).upper(), 0)
+    
+    def sort_key(self, result):
+        """Return the value results are compared by for the current sort field"""
+        if self.sort_field in ('seeds', 'leeches'):
+            value = result[self.sort_field].replace(',', '')
+            return int(value) if value.isdigit() else 0
+        if self.sort_field == 'size':
+            return self.size_to_bytes(result['size'])
+        return result[self.sort_field].lower()
+    
+    def filtered_rows(self, results):
+        """Keep only the results matching the current filter"""
+        if not self.filter_text:
+            return list(results)
+        needle = self.filter_text.lower()
+        return [r for r in results if needle in r['name'].lower() or needle in r['category'].lower()]
+    
+    def sorted_rows(self, results):
+        """Sort results by the current sort field"""
+        return sorted(results, key=self.sort_key, reverse=self.sort_field in ('seeds', 'leeches', 'size'))
+    
+    def rebuild_view(self):
+        """Re-filter and re-sort every cached result, used after a sort or filter change"""
+        results = [r for pages in self.pages.values() for page in pages for r in page]
+        self.view = self.sorted_rows(self.filtered_rows(results))
+        if self.limit:
+            del self.view[self.limit:]
+        self.offset = 0
+    
+    def next_page(self):
+        """Move to the next window, fetching at most one round of pages
+        
+        Returns True when the window moved or gained rows, None when a fetch
+        added nothing but more may still come, and False at the end.
+        """
+        window_end = self.offset + self.window
+        if window_end >= len(self.view):
+            if not self.can_load_more():
+                return False
+            partial = window_end > len(self.view)
+            if not self.load_more():
+                return None if self.can_load_more() else False
+            # A partial window is filled in place instead of skipping past the new rows
+            if partial or window_end >= len(self.view):
+                return True
+        self.offset = window_end
+        return True
+    
+    def prev_page(self):
+        """Move to the previous window, return False on the first one"""
+        if self.offset == 0:
+            return False
+        self.offset = max(0, self.offset - self.window)
+        return True
+    
+    def render(self):
+        """Print the visible window of the result table"""
+        visible = self.view[self.offset:self.offset + self.window]
+        
+        print(colored("\n" + "=" * 80, "cyan"))
+        print(colored("SEARCH RESULTS", "cyan", attrs=["bold"]))
+        print(colored("=" * 80, "cyan"))
+        
+        formatted_results = self.searcher.format_results(visible, self.offset + 1)
+        print(tabulate(formatted_results, headers=self.headers, tablefmt="grid"))
+        
+        more = "+" if self.can_load_more() else ""
+        first = self.offset + 1 if visible else self.offset
+        status = f"\nShowing {first}-{self.offset + len(visible)} of {len(self.view)}{more} results"
+        status += f" | sorted by {self.sort_field}"
+        if self.filter_text:
+            status += f" | filter: '{self.filter_text}'"
+        print(colored(status, "green", attrs=["bold"]))
+        if len(visible) < self.window and self.can_load_more():
+            print(colored("Press n to load more results", "cyan"))
+        print(colored("Green = VIP | Magenta = Trusted", "yellow"))
+    
+    def show_details(self, result):
+        """Print every field of a single result"""
+        print(colored(f"\nTorrent Details:", "yellow", attrs=["bold"]))
+        print(colored("-" * 40, "yellow"))
+        print(f"Name: {result['name']}")
+        print(f"Site: {result['site']}")
+        print(f"Category: {result['category']}")
+        print(f"Uploader: {result['uploader']}")
+        print(f"Size: {result['size']}")
+        print(f"Seeds: {result['seeds']}")
+        print(f"Leeches: {result['leeches']}")
+        print(f"Date: {result['date']}")
+        print(f"Detail URL: {result['detail_url']}")
+        print(colored("-" * 40, "yellow"))
+    
+    def print_help(self):
+        """Print the interactive commands"""
+        print(colored("\nCommands:", "cyan"))
+        print("  <index>        View torrent details")
+        print("  n / p          Next / previous page (more results are fetched as needed)")
+        print(f"  s <field>      Sort by {', '.join(self.sort_fields)}")
+        print("  f <text>       Filter by name or category, 'f' alone clears the filter")
+        print("  r              Redraw the current page")
+        print("  0 / exit       Quit")
+    
+    def run(self):
+        """Interactive loop over the result window"""
+        self.render()
+        self.print_help()
+        
+        while True:
+            try:
+                choice = input(colored("Index > ", "blue")).strip()
+                command, _, argument = choice.partition(' ')
+                command = command.lower()
+                argument = argument.strip()
+                
+                if choice == '0' or command == 'exit':
+                    break
+                elif command in ('n', 'next'):
+                    moved = self.next_page()
+                    if moved is None:
+                        print(colored("No new results were loaded, press n to try again", "yellow"))
+                        continue
+                    if not moved:
+                        print(colored("No more results!", "red"))
+                        continue
+                    self.render()
+                elif command in ('p', 'prev'):
+                    if not self.prev_page():
+                        print(colored("Already on the first page!", "red"))
+                        continue
+                    self.render()
+                elif command in ('s', 'sort'):
+                    if argument.lower() not in self.sort_fields:
+                        print(colored(f"Sort field must be one of: {', '.join(self.sort_fields)}", "red"))
+                        continue
+                    self.sort_field = argument.lower()
+                    self.rebuild_view()
+                    self.render()
+                elif command in ('f', 'filter'):
+                    self.filter_text = argument or None
+                    self.rebuild_view()
+                    self.render()
+                elif command in ('r', 'redraw'):
+                    self.render()
+                elif command in ('h', 'help', '?'):
+                    self.print_help()
+                else:
+                    try:
+                        index = int(choice) - 1
+                        if 0 <= index < len(self.view):
+                            self.show_details(self.view[index])
+                        else:
+                            print(colored("Invalid index! Please try again.", "red"))
+                    except ValueError:
+                        print(colored("Please enter a valid number or command (h for help)!", "red"))
+            
+            except (KeyboardInterrupt, EOFError):
+                break
+
 def main():
     parser = argparse.ArgumentParser(
         description="Enhanced Torrench - Multi-site torrent search tool"
@@ -529,6 +773,13 @@ def main():
         default=None,
         metavar="N"
     )
+    parser.add_argument(
+        "-w", "--window",
+        type=int,
+        help="Number of results shown per page in the browser (default: 20)",
+        default=20,
+        metavar="N"
+    )
     parser.add_argument(
         "-v", "--version",
         action="version",
@@ -546,6 +797,10 @@ def main():
         print(colored("Page limit must be between 1 and 10", "red"))
         sys.exit(1)
     
+    if args.window <= 0:
+        print(colored("Window size must be at least 1", "red"))
+        sys.exit(1)
+    
     print(colored("Enhanced Torrench - Multi-site Torrent Search", "cyan", attrs=["bold"]))
     print(colored("=" * 50, "cyan"))
     
@@ -557,66 +812,14 @@ def main():
     
     print(colored(f"\nSearching for: '{args.search}'", "yellow", attrs=["bold"]))
     
-    results = searcher.search_all_sites(args.search, args.pages)
+    browser = ResultBrowser(searcher, args.search, args.window, args.limit)
+    browser.load_pages(args.pages)
     
-    if not results:
+    if not browser.view:
         print(colored("No results found!", "red"))
         sys.exit(0)
     
-    # Sort results by seeds (descending)
-    results.sort(key=lambda x: int(x['seeds']) if x['seeds'].isdigit() else 0, reverse=True)
-    
-    # Apply limit if specified
-    if args.limit:
-        results = results[:args.limit]
-    
-    # Display results
-    formatted_results = searcher.format_results(results)
-    
-    print(colored("\n" + "=" * 80, "cyan"))
-    print(colored("SEARCH RESULTS", "cyan", attrs=["bold"]))
-    print(colored("=" * 80, "cyan"))
-    
-    headers = ['SITE', 'CATEGORY', 'NAME', 'INDEX', 'UPLOADER', 'SIZE', 'SEEDS', 'LEECHES', 'DATE']
-    table = tabulate(formatted_results, headers=headers, tablefmt="grid")
-    print(table)
-    
-    print(colored(f"\nTotal results: {len(results)}", "green", attrs=["bold"]))
-    print(colored("Green = VIP | Magenta = Trusted", "yellow"))
-    
-    # Interactive detail viewing
-    print(colored("\nEnter torrent index to view details (0 to exit):", "cyan"))
-    
-    while True:
-        try:
-            choice = input(colored("Index > ", "blue")).strip()
-            
-            if choice == '0' or choice.lower() == 'exit':
-                break
-            
-            try:
-                index = int(choice) - 1
-                if 0 <= index < len(results):
-                    result = results[index]
-                    print(colored(f"\nTorrent Details:", "yellow", attrs=["bold"]))
-                    print(colored("-" * 40, "yellow"))
-                    print(f"Name: {result['name']}")
-                    print(f"Site: {result['site']}")
-                    print(f"Category: {result['category']}")
-                    print(f"Uploader: {result['uploader']}")
-                    print(f"Size: {result['size']}")
-                    print(f"Seeds: {result['seeds']}")
-                    print(f"Leeches: {result['leeches']}")
-                    print(f"Date: {result['date']}")
-                    print(f"Detail URL: {result['detail_url']}")
-                    print(colored("-" * 40, "yellow"))
-                else:
-                    print(colored("Invalid index! Please try again.", "red"))
-            except ValueError:
-                print(colored("Please enter a valid number!", "red"))
-                
-        except KeyboardInterrupt:
-            break
+    browser.run()
     
     print(colored("\nThank you for using Enhanced Torrench!", "green", attrs=["bold"]))
 